@@ -0,0 +1,17 @@
+"""Shared pytest configuration for the Turfoo service."""
+
+import os
+
+# turfoo.settings loads Settings() at import; give it a complete environment
+for _name, _value in {
+    "TURFOO_PROGRAM_FEED_URL": "https://turfoo.test/program.xml",
+    "TURFOO_NEWS_FEED_URL": "https://turfoo.test/news.xml",
+    "TURFOO_RESULTS_FEED_URL": "https://turfoo.test/results.xml",
+    "CACHE_REDIS_HOST": "localhost",
+    "CACHE_REDIS_PASSWORD": "test",
+    "S3_ENDPOINT_URL": "http://localhost:9000",
+    "S3_ACCESS_KEY_ID": "test",
+    "S3_SECRET_ACCESS_KEY": "test",
+    "S3_TURFOO_BUCKET_NAME": "test",
+}.items():
+    os.environ.setdefault(_name, _value)
@@ -0,0 +1,91 @@
+"""Tests for the columnar RaceEntryTable."""
+
+import datetime
+
+import numpy as np
+import pytest
+
+from turfoo import models, tables
+
+
+@pytest.fixture
+def entries() -> list[models.RaceEntry]:
+    """Three race entries across two surfaces, one with missing payouts."""
+    track = models.Track(name="Longchamp", location="Paris", surface_type="turf")
+    races = [
+        models.Race(
+            date=datetime.datetime(2026, 10, 4, tzinfo=datetime.UTC),
+            track=track,
+            race_number=number,
+            distance_furlongs=12.0,
+            surface=surface,
+            track_condition="good",
+            purse=5_000_000.0,
+            race_type="group 1",
+        )
+        for number, surface in ((1, "turf"), (2, "dirt"))
+    ]
+    horse = models.Horse(name="Ace", birth_year=2022, sex="M", sire=None, dam=None)
+    jockey = models.Jockey(name="J. Doe")
+    trainer = models.Trainer(name="T. Roe")
+    return [
+        models.RaceEntry(
+            race=races[0],
+            horse=horse,
+            jockey=jockey,
+            trainer=trainer,
+            post_position=3,
+            morning_line_odds="5/2",
+            finish_position=1,
+            win_payout=12.30,
+            place_payout=5.10,
+            show_payout=3.20,
+        ),
+        models.RaceEntry(
+            race=races[0],
+            horse=horse,
+            jockey=jockey,
+            trainer=trainer,
+            post_position=7,
+            morning_line_odds="10/1",
+            finish_position=4,
+            win_payout=None,
+            place_payout=None,
+            show_payout=None,
+        ),
+        models.RaceEntry(
+            race=races[1],
+            horse=horse,
+            jockey=jockey,
+            trainer=trainer,
+            post_position=1,
+            morning_line_odds="3/1",
+            finish_position=1,
+            win_payout=8.40,
+            place_payout=4.00,
+            show_payout=2.60,
+        ),
+    ]
+
+
+def test_round_trip(entries: list[models.RaceEntry]) -> None:
+    """Rows rebuild to the original entries, including missing payouts."""
+    table = tables.from_entries(entries)
+
+    assert len(table) == len(entries)
+    assert list(tables.to_entries(table, range(len(table)))) == entries
+
+
+def test_columns(entries: list[models.RaceEntry]) -> None:
+    """Numeric columns aggregate and categorical columns decode."""
+    table = tables.from_entries(entries)
+
+    assert np.isnan(table.win_payout[1])
+    assert np.nansum(table.win_payout) == pytest.approx(20.70)
+    assert table.surface_categories == ("turf", "dirt")
+    assert list(table.surface) == ["turf", "turf", "dirt"]
+    winners = np.flatnonzero(table.finish_position == 1)
+    assert [entry.post_position for entry in tables.to_entries(table, winners)] == [
+        3,
+        1,
+    ]
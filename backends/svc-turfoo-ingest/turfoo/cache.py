@@ -1,22 +1,22 @@
 import redis
 
-from turfoo import settings
+from turfoo import redis_pool, settings
 
 # Test connection
 try:
     print("Testing Redis connection...")
-    print(f"Connecting to Redis at {settings.conf.redis_url}")
-    r = redis.from_url(settings.conf.redis_url, decode_responses=True)
+    print(f"Connecting to Redis at {settings.settings.redis_url}")
+    r = redis_pool.get_redis()
     r.ping()
     print("✅ Redis connected")
 
-    # Test set/get
-    r.set("test_key", "test_value")
-    val = r.get("test_key")
-    print(f"✅ Set/Get works: {val}")
-
-
-    r.delete("test_key")
+    # Test set/get/delete in a single round-trip
+    pipe = r.pipeline(transaction=False)
+    pipe.set("test_key", "test_value")
+    pipe.get("test_key")
+    pipe.delete("test_key")
+    _, val, _ = pipe.execute()
+    print(f"✅ Set/Get/Delete works: {val}")
     print("✅ Redis test complete")
 
 except redis.ConnectionError as e:
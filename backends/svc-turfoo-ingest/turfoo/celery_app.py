@@ -21,8 +21,13 @@ app.conf.update(
     task_track_started=True,
     task_time_limit=30 * 60,  # 30 minutes
     task_soft_time_limit=25 * 60,  # 25 minutes
-    worker_prefetch_multiplier=1,
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
+    broker_connection_retry_on_startup=True,
+    # Feed fetches are short and I/O-bound: prefetch hides broker latency
+    worker_prefetch_multiplier=4,
     worker_max_tasks_per_child=1000,
+    worker_max_memory_per_child=200_000,  # KiB (~200 MB)
 )
 
 # Auto-discover tasks from turfoo.tasks module
@@ -10,49 +10,48 @@ from pydantic import HttpUrl
 from turfoo import settings
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RSSDetail:
     type: str
     language: str
     base: HttpUrl
     value: str
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RSSLink:
     rel: str
     type: str
     href: HttpUrl
 
 class RSSFeedType(Enum):
-    PROGRAM = settings.conf.TURFOO_PROGRAM_FEED_URL
-    NEWS = settings.conf.TURFOO_NEWS_FEED_URL
-    RESULTS = settings.conf.TURFOO_RESULTS_FEED_URL
+    PROGRAM = str(settings.settings.turfoo_program_feed_url)
+    NEWS = str(settings.settings.turfoo_news_feed_url)
+    RESULTS = str(settings.settings.turfoo_results_feed_url)
     @property
     def url_str(self) -> str:
-        return str(self.value)
+        return self.value
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RSSEntry:
     title: str
     title_detail: RSSDetail
     links: list[RSSLink]
     link: HttpUrl
-    published: dt
+    published: str
     published_parsed: Any
     id: HttpUrl
     guidislink: bool
     summary: str
     summary_detail: RSSDetail
-    published: str
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Track:
     name: str
     location: str
     surface_type: str
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Horse:
     name: str
     birth_year: int
@@ -60,15 +59,15 @@ class Horse:
     sire: Horse | str | None
     dam: Horse | str | None
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Jockey:
     name: str
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Trainer:
     name: str
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Race:
     date: dt
     track: Track
@@ -79,7 +78,7 @@ class Race:
     purse: float
     race_type: str
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RaceEntry:
     race: Race
     horse: Horse
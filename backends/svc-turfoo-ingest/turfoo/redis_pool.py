@@ -0,0 +1,30 @@
+"""Shared Redis connection pool for Turfoo."""
+
+import functools
+
+import redis
+
+from turfoo import settings
+
+
+@functools.cache
+def _get_pool() -> redis.BlockingConnectionPool:
+    """Return the process-wide Redis connection pool, built on first use.
+
+    Returns:
+        The shared blocking connection pool.
+    """
+    return redis.BlockingConnectionPool.from_url(
+        settings.settings.redis_url,
+        max_connections=32,
+        decode_responses=True,
+    )
+
+
+def get_redis() -> redis.Redis:
+    """Get a Redis client backed by the shared connection pool.
+
+    Returns:
+        A Redis client that borrows connections from the process-wide pool.
+    """
+    return redis.Redis(connection_pool=_get_pool())
@@ -1,20 +1,92 @@
-from dataclasses import asdict
-from urllib import error
+import asyncio
+import atexit
+import concurrent.futures
+import dataclasses
+import functools
+import operator
+from collections.abc import AsyncIterator
+from typing import Self
 
 import feedparser
 import httpx
+from loguru import logger
 from pydantic import HttpUrl
 
 from turfoo import exceptions, mixins, models
 
 
+@functools.cache
+def get_client() -> httpx.Client:
+    """Return the process-wide pooled HTTP client.
+
+    Built on first use and closed at interpreter exit, so every caller in a
+    worker process reuses the same keep-alive connections.
+
+    Returns:
+        The shared httpx client.
+    """
+    transport = httpx.HTTPTransport(
+        http2=True,
+        retries=2,
+        limits=httpx.Limits(max_keepalive_connections=20),
+    )
+    client = httpx.Client(transport=transport, timeout=10.0)
+    atexit.register(client.close)
+    return client
+
+
+# Positional getter over RSSEntry's fields, in declaration order
+_get_rss_entry_values = operator.itemgetter(
+    *(field.name for field in dataclasses.fields(models.RSSEntry)),
+)
+
+
+def _to_rss_entries(
+    entries: list[feedparser.FeedParserDict],
+) -> mixins.Iterator[models.RSSEntry]:
+    built = 0
+    for entry in entries:
+        try:
+            values = _get_rss_entry_values(entry)
+        except KeyError as e:
+            logger.warning(
+                f"Skipping RSS entry {entry.get('id', '<no id>')}: missing field {e}",
+            )
+            continue
+        built += 1
+        yield models.RSSEntry(*values)
+
+    if entries and not built:
+        raise exceptions.TurfooFeedError(
+            f"All {len(entries)} RSS entries were missing required fields",
+        )
+
+
 class TurfooRSSFeed(mixins.FetchableMixin):
+    """Fetch Turfoo RSS feeds over pooled HTTP/2 connections."""
+
+    def __init__(self, client: httpx.Client | None = None) -> None:
+        """Initialize the feed reader.
+
+        Args:
+            client: HTTP client to fetch with; defaults to the shared one.
+        """
+        self._client = client or get_client()
 
     def fetch(self, feed_type: models.RSSFeedType) -> mixins.Iterator[models.RSSEntry]:
         try:
-            feed: feedparser.FeedParserDict = feedparser.parse(str(feed_type.value))
-        except error.URLError as e:
-            raise exceptions.TurfooFeedError(...) from e
+            response = self._client.get(feed_type.url_str, follow_redirects=True)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            raise exceptions.TurfooFeedError(
+                f"Failed to fetch {feed_type.url_str}: {e}",
+            ) from e
+
+        feed: feedparser.FeedParserDict = feedparser.parse(
+            response.content,
+            sanitize_html=False,
+            resolve_relative_uris=False,
+        )
 
         if feed.bozo:
             raise exceptions.TurfooFeedError(
@@ -24,20 +96,84 @@ class TurfooRSSFeed(mixins.FetchableMixin):
         if not feed.entries:
             raise exceptions.TurfooFeedError("RSS feed contains no entries")
 
-        yield from (models.RSSEntry(**entry) for entry in feed.entries)
+        yield from _to_rss_entries(feed.entries)
 
 
 
 
 class TurfooLinkScraper(mixins.FetchableMixin,mixins.ReadableMixin):
+    """Fetch linked Turfoo pages over pooled HTTP/2 connections."""
+
+    def __init__(self, client: httpx.Client | None = None) -> None:
+        """Initialize the scraper.
+
+        Args:
+            client: HTTP client for sync fetches; defaults to the shared one.
+        """
+        self._client = client or get_client()
+        self._async_client: httpx.AsyncClient | None = None
+
+    async def __aenter__(self) -> Self:
+        """Open the async HTTP/2 client used by fetch_async."""
+        self._async_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+        )
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        """Close the async HTTP/2 client."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
+    @staticmethod
+    async def _get(client: httpx.AsyncClient, url: HttpUrl) -> httpx.Response:
+        response = await client.get(str(url))
+        response.raise_for_status()
+        return response
+
+    async def fetch_async(self, urls: list[HttpUrl]) -> AsyncIterator[str]:
+        """Fetch all urls concurrently and yield their bodies in request order.
+
+        Args:
+            urls: Pages to fetch.
+
+        Yields:
+            The text body of each page.
+
+        Raises:
+            TurfooLinkScrapeError: If the scraper is not entered or any request fails.
+        """
+        client = self._async_client
+        if client is None:
+            raise exceptions.TurfooLinkScrapeError(
+                "TurfooLinkScraper must be used as an async context manager",
+            )
+
+        responses = await asyncio.gather(
+            *(self._get(client, url) for url in urls),
+            return_exceptions=True,
+        )
+        for url, response in zip(urls, responses, strict=True):
+            if isinstance(response, BaseException):
+                raise exceptions.TurfooLinkScrapeError(
+                    f"Failed to fetch {url}: {response}",
+                ) from response
+            yield response.text
+
+    def _get_text(self, url: HttpUrl) -> str:
+        try:
+            response = self._client.get(str(url))
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            raise exceptions.TurfooLinkScrapeError(f"Failed to fetch {url}: {e}") from e
+        return response.text
+
     def fetch(self, urls: list[HttpUrl]) -> mixins.Iterator[str]:
-        for url in urls:
-            try:
-                response = httpx.get(str(url))
-                response.raise_for_status()
-                yield response.text
-            except httpx.HTTPError as e:
-                raise exceptions.TurfooLinkScrapeError(f"Failed to fetch {url}: {e}") from e
+        # httpx.Client is thread-safe, so the threads share its connection pool
+        with concurrent.futures.ThreadPoolExecutor(max_workers=16) as executor:
+            yield from executor.map(self._get_text, urls)
 
 
 
@@ -45,6 +181,6 @@ if __name__ == "__main__":
     turfool_provider = TurfooRSSFeed()
     rss_content = turfool_provider.fetch(models.RSSFeedType.NEWS)
     for entry in rss_content:
-        print(asdict(entry))
+        print(dataclasses.asdict(entry))
         break
 
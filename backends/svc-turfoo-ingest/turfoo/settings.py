@@ -1,5 +1,6 @@
 """Application settings for Turfoo."""
 
+import functools
 import logging
 
 from pydantic import HttpUrl
@@ -35,12 +36,12 @@ class Settings(BaseSettings):
     celery_broker_url: str | None = None
     celery_result_backend: str | None = None
 
-    @property
+    @functools.cached_property
     def redis_url(self) -> str:
         """Get Redis connection URL."""
         return f"redis://{self.cache_redis_username}:{self.cache_redis_password}@{self.cache_redis_host}:{self.cache_redis_port}"
 
-    @property
+    @functools.cached_property
     def s3_endpoint(self) -> str:
         """Convert HttpUrl to string for boto3."""
         return str(self.s3_endpoint_url)
@@ -0,0 +1,175 @@
+"""Columnar (structure-of-arrays) views over batches of Turfoo models."""
+
+from __future__ import annotations
+
+import dataclasses
+import operator
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from turfoo import models
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+
+@dataclasses.dataclass(frozen=True, slots=True, eq=False)
+class RaceEntryTable:
+    """Race entries stored as one array per column.
+
+    Numeric columns are typed arrays so aggregations such as
+    ``table.win_payout.sum()`` run in NumPy instead of over Python objects.
+    Missing payouts are stored as NaN. ``surface`` and ``race_type`` are
+    dictionary-encoded: an int16 code per row indexing the matching
+    ``*_categories`` tuple.
+    """
+
+    race: np.ndarray
+    horse: np.ndarray
+    jockey: np.ndarray
+    trainer: np.ndarray
+    post_position: np.ndarray
+    morning_line_odds: np.ndarray
+    finish_position: np.ndarray
+    win_payout: np.ndarray
+    place_payout: np.ndarray
+    show_payout: np.ndarray
+    surface_codes: np.ndarray
+    surface_categories: tuple[str, ...]
+    race_type_codes: np.ndarray
+    race_type_categories: tuple[str, ...]
+
+    def __len__(self) -> int:
+        """Number of rows."""
+        return len(self.post_position)
+
+    @property
+    def surface(self) -> np.ndarray:
+        """Decoded surface of each row."""
+        return np.asarray(self.surface_categories, dtype=object)[self.surface_codes]
+
+    @property
+    def race_type(self) -> np.ndarray:
+        """Decoded race type of each row."""
+        return np.asarray(self.race_type_categories, dtype=object)[
+            self.race_type_codes
+        ]
+
+
+def _column(
+    entries: tuple[models.RaceEntry, ...],
+    getter: Callable[[models.RaceEntry], Any],
+    dtype: Any,
+) -> np.ndarray:
+    return np.fromiter(map(getter, entries), dtype=dtype, count=len(entries))
+
+
+def _payout_column(
+    entries: tuple[models.RaceEntry, ...],
+    getter: Callable[[models.RaceEntry], float | None],
+) -> np.ndarray:
+    payouts = (np.nan if payout is None else payout for payout in map(getter, entries))
+    return np.fromiter(payouts, dtype=np.float64, count=len(entries))
+
+
+def _encode(
+    entries: tuple[models.RaceEntry, ...],
+    getter: Callable[[models.RaceEntry], str],
+) -> tuple[tuple[str, ...], np.ndarray]:
+    index: dict[str, int] = {}
+    codes = np.fromiter(
+        (index.setdefault(value, len(index)) for value in map(getter, entries)),
+        dtype=np.int16,
+        count=len(entries),
+    )
+    return tuple(index), codes
+
+
+def _optional(value: np.floating) -> float | None:
+    return None if np.isnan(value) else float(value)
+
+
+def from_entries(entries: Iterable[models.RaceEntry]) -> RaceEntryTable:
+    """Build a columnar table from race entries.
+
+    Args:
+        entries: Race entries, in row order.
+
+    Returns:
+        The entries as a RaceEntryTable.
+    """
+    entries = tuple(entries)
+    surface_categories, surface_codes = _encode(
+        entries,
+        operator.attrgetter("race.surface"),
+    )
+    race_type_categories, race_type_codes = _encode(
+        entries,
+        operator.attrgetter("race.race_type"),
+    )
+    return RaceEntryTable(
+        race=_column(entries, operator.attrgetter("race"), object),
+        horse=_column(entries, operator.attrgetter("horse"), object),
+        jockey=_column(entries, operator.attrgetter("jockey"), object),
+        trainer=_column(entries, operator.attrgetter("trainer"), object),
+        post_position=_column(entries, operator.attrgetter("post_position"), np.int16),
+        morning_line_odds=_column(
+            entries,
+            operator.attrgetter("morning_line_odds"),
+            object,
+        ),
+        finish_position=_column(
+            entries,
+            operator.attrgetter("finish_position"),
+            np.int16,
+        ),
+        win_payout=_payout_column(entries, operator.attrgetter("win_payout")),
+        place_payout=_payout_column(entries, operator.attrgetter("place_payout")),
+        show_payout=_payout_column(entries, operator.attrgetter("show_payout")),
+        surface_codes=surface_codes,
+        surface_categories=surface_categories,
+        race_type_codes=race_type_codes,
+        race_type_categories=race_type_categories,
+    )
+
+
+def to_entry(table: RaceEntryTable, index: int) -> models.RaceEntry:
+    """Rebuild a single race entry from a table row.
+
+    Args:
+        table: Source table.
+        index: Row index.
+
+    Returns:
+        The race entry stored at that row.
+    """
+    return models.RaceEntry(
+        race=table.race[index],
+        horse=table.horse[index],
+        jockey=table.jockey[index],
+        trainer=table.trainer[index],
+        post_position=int(table.post_position[index]),
+        morning_line_odds=table.morning_line_odds[index],
+        finish_position=int(table.finish_position[index]),
+        win_payout=_optional(table.win_payout[index]),
+        place_payout=_optional(table.place_payout[index]),
+        show_payout=_optional(table.show_payout[index]),
+    )
+
+
+def to_entries(
+    table: RaceEntryTable,
+    indices: Iterable[int],
+) -> Iterator[models.RaceEntry]:
+    """Rebuild the race entries at the given rows.
+
+    Args:
+        table: Source table.
+        indices: Row indices, e.g. ``np.flatnonzero(table.finish_position == 1)``.
+
+    Yields:
+        The race entry stored at each row.
+    """
+    for index in indices:
+        yield to_entry(table, index)
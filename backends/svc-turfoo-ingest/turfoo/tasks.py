@@ -1,39 +1,105 @@
 """Celery tasks for Turfoo data ingestion."""
 
+import io
+
+import celery
 import feedparser
+import httpx
 from loguru import logger
 
+from turfoo import models, redis_pool, resources
 from turfoo.celery_app import app
 
+ETAG_CACHE_KEY = "feed:etag"
+MODIFIED_CACHE_KEY = "feed:mod"
+ENTRIES_CACHE_KEY = "feed:entries"
+
+FEEDS = {feed_type.name.lower(): feed_type.url_str for feed_type in models.RSSFeedType}
+
+
+@app.task(name="turfoo.tasks.fetch_feed")
+def fetch_feed(url: str, kind: str):
+    """Conditionally fetch and parse one feed from Turfoo.
+
+    The validators from the previous fetch are sent as If-None-Match and
+    If-Modified-Since, and the new ones are stored back in one pipeline.
+    Turfoo is a trusted source, so HTML sanitizing and relative URI
+    resolution are skipped. HTTP failures are logged and reported in the
+    result rather than raised, so a chord callback still runs.
+
+    Args:
+        url: Feed URL.
+        kind: Feed name used in logs and results, e.g. "program".
+
+    Returns:
+        A summary of the fetch.
+    """
+    cache = redis_pool.get_redis()
+    pipe = cache.pipeline(transaction=False)
+    pipe.hget(ETAG_CACHE_KEY, url)
+    pipe.hget(MODIFIED_CACHE_KEY, url)
+    etag, modified = pipe.execute()
+
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if modified:
+        headers["If-Modified-Since"] = modified
 
-@app.task(name="turfoo.tasks.fetch_program_feed")
-def fetch_program_feed():
-    """Fetch and parse the program feed from Turfoo."""
-    from turfoo.settings import settings
+    logger.info(f"Fetching {kind} feed from {url}")
+    try:
+        response = resources.get_client().get(
+            url,
+            headers=headers,
+            follow_redirects=True,
+        )
+        if response.status_code == httpx.codes.NOT_MODIFIED:
+            logger.info(f"{kind.capitalize()} feed not modified since last fetch")
+            return {"kind": kind, "url": url, "modified": False}
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        logger.warning(f"Failed to fetch {kind} feed from {url}: {e}")
+        return {"kind": kind, "url": url, "modified": False, "error": str(e)}
 
-    logger.info(f"Fetching program feed from {settings.turfoo_program_feed_url}")
-    feed = feedparser.parse(settings.turfoo_program_feed_url)
-    logger.info(f"Fetched {len(feed.entries)} program entries")
-    return {"entries": len(feed.entries), "title": feed.feed.get("title", "Unknown")}
+    pipe = cache.pipeline(transaction=False)
+    if "ETag" in response.headers:
+        pipe.hset(ETAG_CACHE_KEY, url, response.headers["ETag"])
+    if "Last-Modified" in response.headers:
+        pipe.hset(MODIFIED_CACHE_KEY, url, response.headers["Last-Modified"])
+    pipe.execute()
 
+    feed = feedparser.parse(
+        io.BytesIO(response.content),
+        sanitize_html=False,
+        resolve_relative_uris=False,
+    )
+    logger.info(f"Fetched {len(feed.entries)} {kind} entries")
+    return {
+        "kind": kind,
+        "url": url,
+        "modified": True,
+        "entries": len(feed.entries),
+        "title": feed.feed.get("title", "Unknown"),
+    }
 
-@app.task(name="turfoo.tasks.fetch_news_feed")
-def fetch_news_feed():
-    """Fetch and parse the news feed from Turfoo."""
-    from turfoo.settings import settings
 
-    logger.info(f"Fetching news feed from {settings.turfoo_news_feed_url}")
-    feed = feedparser.parse(settings.turfoo_news_feed_url)
-    logger.info(f"Fetched {len(feed.entries)} news entries")
-    return {"entries": len(feed.entries), "title": feed.feed.get("title", "Unknown")}
+@app.task(name="turfoo.tasks.record_feeds", ignore_result=True)
+def record_feeds(results: list[dict]) -> None:
+    """Store the entry counts of a batch of feed fetches in one round-trip.
 
+    Args:
+        results: fetch_feed results, as delivered by the chord.
+    """
+    pipe = redis_pool.get_redis().pipeline(transaction=False)
+    for result in results:
+        if result["modified"]:
+            pipe.hset(ENTRIES_CACHE_KEY, result["url"], result["entries"])
+    pipe.execute()
 
-@app.task(name="turfoo.tasks.fetch_results_feed")
-def fetch_results_feed():
-    """Fetch and parse the results feed from Turfoo."""
-    from turfoo.settings import settings
 
-    logger.info(f"Fetching results feed from {settings.turfoo_results_feed_url}")
-    feed = feedparser.parse(settings.turfoo_results_feed_url)
-    logger.info(f"Fetched {len(feed.entries)} results entries")
-    return {"entries": len(feed.entries), "title": feed.feed.get("title", "Unknown")}
+@app.task(name="turfoo.tasks.fetch_all_feeds", ignore_result=True)
+def fetch_all_feeds() -> None:
+    """Fetch every Turfoo feed in parallel and record their counts together."""
+    celery.chord(fetch_feed.s(url, kind) for kind, url in FEEDS.items())(
+        record_feeds.s(),
+    )
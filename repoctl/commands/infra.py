@@ -1,5 +1,8 @@
 """Infrastructure management CLI commands."""
 
+import concurrent.futures
+import functools
+import operator
 import os
 import shutil
 import subprocess
@@ -17,22 +20,24 @@ class MonorepoRootNotFoundError(Exception):
         super().__init__("Could not find monorepo root directory")
 
 
+@functools.cache
 def get_monorepo_root() -> Path:
     """Get the monorepo root directory."""
     # Start from this file and go up to find the root
-    current = Path(__file__).resolve()
-    while current.parent != current:
+    here = Path(__file__).resolve()
+    for current in (here, *here.parents):
         if (current / "repoctl").exists() and (current / "infra").exists():
             return current
-        current = current.parent
     raise MonorepoRootNotFoundError
 
 
+@functools.cache
 def get_global_compose_file() -> Path:
     """Get path to global compose file."""
     return get_monorepo_root() / "infra" / "compose.global.yml"
 
 
+@functools.cache
 def get_global_env_file() -> Path:
     """Get path to global env file."""
     return get_monorepo_root() / "infra" / ".env.global"
@@ -43,17 +48,63 @@ def get_project_infra_dir(project_name: str) -> Path:
     return get_monorepo_root() / "backends" / project_name / "infra"
 
 
-def run_docker_compose(compose_file: Path, env_file: Path | None, *args: str) -> int:
-    """Run docker compose with the given arguments."""
+def get_project_dirs() -> list[Path]:
+    """Get backend project directories that have infrastructure, sorted by name."""
+    backends_dir = get_monorepo_root() / "backends"
+    with os.scandir(backends_dir) as entries:
+        # DirEntry.is_dir() uses the type cached from the directory listing
+        project_entries = sorted(
+            (entry for entry in entries if entry.is_dir()),
+            key=operator.attrgetter("name"),
+        )
+    return [
+        Path(entry.path)
+        for entry in project_entries
+        if (Path(entry.path) / "infra").is_dir()
+    ]
+
+
+def run_docker_compose(
+    compose_file: Path,
+    env_file: Path | None,
+    *args: str,
+    cwd: Path | None = None,
+) -> int:
+    """Run docker compose with the given arguments, optionally from cwd."""
     cmd = ["docker", "compose", "-f", str(compose_file)]
     if env_file and env_file.exists():
         cmd.extend(["--env-file", str(env_file)])
     cmd.extend(args)
 
-    result = subprocess.run(cmd, check=False)
+    result = subprocess.run(cmd, check=False, cwd=cwd)
     return result.returncode
 
 
+def get_project_ps_output(project_infra: Path) -> str:
+    """Get `docker compose ps` output for a project.
+
+    Args:
+        project_infra: Project infrastructure directory.
+
+    Returns:
+        The command output, or a "Not running" notice if it failed.
+    """
+    compose_file = project_infra / "compose.yml"
+    try:
+        result = subprocess.run(
+            ["docker", "compose", "-f", str(compose_file), "ps"],
+            capture_output=True,
+            text=True,
+            check=False,
+            cwd=project_infra,
+        )
+    except Exception:
+        return "  Not running"
+    if result.returncode == 0:
+        return result.stdout
+    return "  Not running"
+
+
 def ensure_global_env() -> None:
     """Ensure global .env file exists."""
     env_file = get_global_env_file()
@@ -178,22 +229,22 @@ def project_start(project_name: str) -> None:
     compose_file = project_infra / "compose.yml"
     env_file = project_infra / ".env"
 
-    # Change to project infra directory for docker compose context
-    original_dir = Path.cwd()
-    os.chdir(project_infra)
-
-    try:
-        exit_code = run_docker_compose(compose_file, env_file, "up", "-d")
+    # Run from the project infra directory for docker compose context
+    exit_code = run_docker_compose(
+        compose_file,
+        env_file,
+        "up",
+        "-d",
+        cwd=project_infra,
+    )
 
-        if exit_code == 0:
-            click.secho("✓", fg="green", nl=False)
-            click.echo(" Project infrastructure started")
-        else:
-            click.secho("✗", fg="red", nl=False)
-            click.echo(" Failed to start project infrastructure")
-            sys.exit(exit_code)
-    finally:
-        os.chdir(original_dir)
+    if exit_code == 0:
+        click.secho("✓", fg="green", nl=False)
+        click.echo(" Project infrastructure started")
+    else:
+        click.secho("✗", fg="red", nl=False)
+        click.echo(" Failed to start project infrastructure")
+        sys.exit(exit_code)
 
 
 @project.command(name="stop")
@@ -213,21 +264,15 @@ def project_stop(project_name: str) -> None:
     compose_file = project_infra / "compose.yml"
     env_file = project_infra / ".env"
 
-    original_dir = Path.cwd()
-    os.chdir(project_infra)
-
-    try:
-        exit_code = run_docker_compose(compose_file, env_file, "down")
+    exit_code = run_docker_compose(compose_file, env_file, "down", cwd=project_infra)
 
-        if exit_code == 0:
-            click.secho("✓", fg="green", nl=False)
-            click.echo(" Project infrastructure stopped")
-        else:
-            click.secho("✗", fg="red", nl=False)
-            click.echo(" Failed to stop project infrastructure")
-            sys.exit(exit_code)
-    finally:
-        os.chdir(original_dir)
+    if exit_code == 0:
+        click.secho("✓", fg="green", nl=False)
+        click.echo(" Project infrastructure stopped")
+    else:
+        click.secho("✗", fg="red", nl=False)
+        click.echo(" Failed to stop project infrastructure")
+        sys.exit(exit_code)
 
 
 @project.command(name="status")
@@ -247,13 +292,7 @@ def project_status(project_name: str) -> None:
     compose_file = project_infra / "compose.yml"
     env_file = project_infra / ".env"
 
-    original_dir = Path.cwd()
-    os.chdir(project_infra)
-
-    try:
-        run_docker_compose(compose_file, env_file, "ps")
-    finally:
-        os.chdir(original_dir)
+    run_docker_compose(compose_file, env_file, "ps", cwd=project_infra)
 
 
 @infra.command(name="init")
@@ -310,19 +349,14 @@ def init_project(project_name: str) -> None:
 @infra.command(name="list")
 def list_projects() -> None:
     """List all projects with infrastructure."""
-    monorepo_root = get_monorepo_root()
-    backends_dir = monorepo_root / "backends"
-
     click.secho("i", fg="blue", nl=False)
     click.echo(" Projects with infrastructure:")
 
-    found_any = False
-    for project_dir in sorted(backends_dir.iterdir()):
-        if project_dir.is_dir() and (project_dir / "infra").exists():
-            click.echo(f"  - {project_dir.name}")
-            found_any = True
+    project_dirs = get_project_dirs()
+    for project_dir in project_dirs:
+        click.echo(f"  - {project_dir.name}")
 
-    if not found_any:
+    if not project_dirs:
         click.echo("  (none)")
 
 
@@ -349,37 +383,20 @@ def show_all_status() -> None:
     click.secho("i", fg="blue", nl=False)
     click.echo(" ═══════════════════════════════════════")
 
-    monorepo_root = get_monorepo_root()
-    backends_dir = monorepo_root / "backends"
+    project_dirs = get_project_dirs()
 
-    original_dir = Path.cwd()
+    # Each docker CLI call is independent and mostly startup latency
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        outputs = executor.map(
+            get_project_ps_output,
+            [project_dir / "infra" for project_dir in project_dirs],
+        )
 
-    for project_dir in sorted(backends_dir.iterdir()):
-        project_infra = project_dir / "infra"
-        if project_dir.is_dir() and project_infra.exists():
+        for project_dir, output in zip(project_dirs, outputs, strict=True):
             click.echo("")
             click.secho("i", fg="blue", nl=False)
             click.echo(f" Project: {project_dir.name}")
-
-            compose_file = project_infra / "compose.yml"
-            env_file = project_infra / ".env"
-
-            os.chdir(project_infra)
-            try:
-                result = subprocess.run(
-                    ["docker", "compose", "-f", str(compose_file), "ps"],
-                    capture_output=True,
-                    text=True,
-                    check=False,
-                )
-                if result.returncode == 0:
-                    click.echo(result.stdout)
-                else:
-                    click.echo("  Not running")
-            except Exception:
-                click.echo("  Not running")
-
-    os.chdir(original_dir)
+            click.echo(output)
 
 
 # Register the global command with proper name